@@ -1,9 +1,12 @@
 """Defines matrix product state class."""
 
 from copy import deepcopy
+import functools
+import string
 from typing import Dict, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
+import opt_einsum as oe
 import tensornetwork as tn
 
 from mpsim.gates import (
@@ -18,19 +21,54 @@ class CannotConvertToMPSOperation(Exception):
     pass
 
 
+@functools.lru_cache(maxsize=None)
+def _one_qudit_contract_expression(
+        qudit_dimension: int, site_shape: Tuple[int, ...], physical_axis: int
+) -> "oe.contract.ContractExpression":
+    """Returns a reusable contraction expression which applies a (d, d) gate
+    matrix to a site tensor of the given shape along the given axis.
+
+    The expression is cached by (qudit_dimension, site_shape, physical_axis),
+    so the contraction path is optimized once per distinct shape and reused
+    for every subsequent application.
+    """
+    nsite_axes = len(site_shape)
+    site_subscripts = list(string.ascii_lowercase[2:2 + nsite_axes])
+    output_subscripts = list(site_subscripts)
+    site_subscripts[physical_axis] = "b"
+    output_subscripts[physical_axis] = "a"
+    equation = "ab,{}->{}".format(
+        "".join(site_subscripts), "".join(output_subscripts)
+    )
+    return oe.contract_expression(
+        equation, (qudit_dimension, qudit_dimension), site_shape
+    )
+
+
 class MPSOperation:
     """Defines an operation which can act on a matrix product state."""
+
+    # One MPSOperation is allocated per gate in a circuit, so avoid the
+    # per-instance __dict__ and make attribute access a fixed-offset load.
+    __slots__ = (
+        "_node", "_tensor", "_qudit_indices", "_qudit_dimension",
+        "_num_qudits", "_dim", "_is_unitary", "_is_diagonal"
+    )
+
     def __init__(
         self,
-        node: tn.Node,
+        node: Union[tn.Node, np.ndarray],
         qudit_indices: Union[int, Tuple[int, ...]],
         qudit_dimension: int = 2
     ) -> None:
         """Initialize an MPS Operation.
 
         Args:
-            node: TensorNetwork node object representing a gate to apply.
-                See Notes below.
+            node: TensorNetwork node object representing a gate to apply,
+                or the raw gate tensor itself. When a raw tensor is given,
+                nodes are constructed lazily (one per call to node()), which
+                avoids per-operation node and edge bookkeeping for gates
+                that are never applied. See Notes below.
             qudit_indices: Index/indices of qudits to apply the gate to.
                 In an MPS, qudits are indexed from the left starting at zero.
             qudit_dimension: Dimension of qudit(s) to which the MPS Operation
@@ -62,11 +100,20 @@ class MPSOperation:
 
                 If index1 > index2, 0 <--> 1 and 2 <--> 3.
         """
-        self._node = node
+        if isinstance(node, tn.Node):
+            self._node = node
+            self._tensor = node.tensor
+        else:
+            self._node = None
+            self._tensor = node
         if isinstance(qudit_indices, int):
             qudit_indices = (qudit_indices,)
         self._qudit_indices = tuple(qudit_indices)
         self._qudit_dimension = int(qudit_dimension)
+        self._num_qudits = len(self._qudit_indices)
+        self._dim = self._qudit_dimension ** self._num_qudits
+        self._is_unitary = None  # type: Optional[bool]
+        self._is_diagonal = None  # type: Optional[bool]
 
     @property
     def qudit_indices(self) -> Tuple[int, ...]:
@@ -81,14 +128,19 @@ class MPSOperation:
     @property
     def num_qudits(self) -> int:
         """Returns the number of qubits the MPS Operation acts on."""
-        return len(self._qudit_indices)
+        return self._num_qudits
 
     def node(self, copy: bool = True) -> tn.Node:
         """Returns the node of the MPS Operation.
 
+        If the MPS Operation stores only the raw gate tensor, a new node
+        (wrapping the stored tensor) is constructed on each call.
+
         Args:
             copy: If True, a copy of the node object is returned.
         """
+        if self._node is None:
+            return tn.Node(self._tensor)
         if not copy:
             return self._node
         node_dict, _ = tn.copy([self._node])
@@ -102,14 +154,54 @@ class MPSOperation:
                     is dim x dim where dim is the qudit dimension raised
                     to the number of qudits that the MPS Operator acts on.
         """
-        tensor = deepcopy(self._node.tensor)
+        tensor = deepcopy(self._tensor)
         if reshape_to_square_matrix:
-            dim = self._qudit_dimension ** self.num_qudits
             tensor = np.reshape(
-                tensor, newshape=(dim, dim)
+                tensor, newshape=(self._dim, self._dim)
             )
         return tensor
 
+    def contract_expression(
+            self, site_shape: Tuple[int, ...], physical_axis: int = 0
+    ) -> "oe.contract.ContractExpression":
+        """Returns a reusable contraction expression which applies the gate
+        matrix of this (single-qudit) MPS Operation to a site tensor.
+
+        The expression is cached by shape, so repeated applications to site
+        tensors of the same shape skip contraction-path optimization and
+        dispatch straight to BLAS.
+
+        Example:
+            >>> expression = mps_operation.contract_expression((2, 1, 4))
+            >>> new_site_tensor = expression(
+            ...     mps_operation.tensor(), site_tensor
+            ... )
+
+        Args:
+            site_shape: Shape of the site tensor the gate is applied to.
+            physical_axis: Axis of the site tensor for the physical (free)
+                index. Default is 0, matching the MPS tensor convention.
+
+        Raises:
+            ValueError: If the MPS Operation acts on more than one qudit, or
+                if the physical axis of the site shape does not have the
+                qudit dimension.
+        """
+        if not self.is_single_qudit_operation():
+            raise ValueError(
+                "Contraction expressions are only supported for single-qudit "
+                f"MPS Operations, but this operation acts on "
+                f"{self.num_qudits} qudits."
+            )
+        if site_shape[physical_axis] != self._qudit_dimension:
+            raise ValueError(
+                f"Dimension of site axis {physical_axis} should be "
+                f"{self._qudit_dimension} but is {site_shape[physical_axis]}."
+            )
+        return _one_qudit_contract_expression(
+            self._qudit_dimension, tuple(site_shape), physical_axis
+        )
+
     def is_valid(self) -> bool:
         """Returns True if the MPS Operation is valid, else False.
 
@@ -120,9 +212,12 @@ class MPSOperation:
             (3) All tensor edges are free edges.
         """
         d = self._qudit_dimension
-        if not self._node.tensor.shape == tuple([d] * 2 * self.num_qudits):
+        if not self._tensor.shape == (d,) * (2 * self._num_qudits):
             return False
-        if not len(self._node.get_all_edges()) == 2 * self.num_qudits:
+        if self._node is None:
+            # Nodes constructed lazily from the tensor have only free edges.
+            return True
+        if not len(self._node.get_all_edges()) == 2 * self._num_qudits:
             return False
         if self._node.has_nondangling_edge():
             return False
@@ -133,8 +228,14 @@ class MPSOperation:
 
         An MPS Operation is unitary if its gate tensor U is unitary, i.e. if
         U^dag @ U = U @ U^dag = I.
+
+        The check is computed once and cached, since the gate tensor does not
+        change after the MPS Operation is constructed.
         """
-        return is_unitary(self.tensor(reshape_to_square_matrix=True))
+        if self._is_unitary is None:
+            matrix = np.reshape(self._tensor, newshape=(self._dim, self._dim))
+            self._is_unitary = is_unitary(matrix)
+        return self._is_unitary
 
     def is_hermitian(self) -> bool:
         """Returns True if the MPS Operation is Hermitian, else False.
@@ -144,6 +245,31 @@ class MPSOperation:
         """
         return is_hermitian(self.tensor(reshape_to_square_matrix=True))
 
+    def is_diagonal(self) -> bool:
+        """Returns True if the gate matrix of the MPS Operation is diagonal,
+        else False.
+
+        Diagonal gates (e.g. Z, T, CZ and their powers) can be applied by
+        multiplying the diagonal into the MPS site tensor(s), skipping the
+        full gate contraction. Only exactly-zero off-diagonal elements
+        count as diagonal, so taking the fast path never changes results.
+
+        The check is computed once and cached, since the gate tensor does
+        not change after the MPS Operation is constructed.
+        """
+        if self._is_diagonal is None:
+            matrix = np.reshape(self._tensor, newshape=(self._dim, self._dim))
+            off_diagonal = matrix - np.diag(np.diag(matrix))
+            self._is_diagonal = not np.any(off_diagonal)
+        return self._is_diagonal
+
+    def diagonal(self) -> np.ndarray:
+        """Returns a copy of the diagonal of the gate matrix of the MPS
+        Operation.
+        """
+        matrix = np.reshape(self._tensor, newshape=(self._dim, self._dim))
+        return np.array(np.diag(matrix))
+
     def is_single_qudit_operation(self) -> bool:
         """Returns True if the MPS Operation acts on a single qudit."""
         return self.num_qudits == 1
@@ -153,7 +279,8 @@ class MPSOperation:
         return self.num_qudits == 2
 
     def __str__(self):
-        return f"Tensor {self._node.name} on qudit(s) {self._qudit_indices}."
+        name = self._node.name if self._node is not None else "(unnamed)"
+        return f"Tensor {name} on qudit(s) {self._qudit_indices}."
 
 
 class MPS:
@@ -844,6 +971,51 @@ class MPS:
         if not is_unitary(gate) and renormalize_after_non_unitary:
             self.renormalize(norm)
 
+    def apply_one_qudit_diagonal_gate(
+        self, diagonal: np.ndarray, node_index: int
+    ) -> None:
+        """Applies a diagonal single qudit gate to a specified node.
+
+        The diagonal is multiplied into the physical index of the site
+        tensor, which costs O(d * chi^2) instead of the O(d^2 * chi^2) of a
+        full gate contraction.
+
+        Args:
+            diagonal: Diagonal of the gate matrix to apply. A vector with
+                qudit_dimension entries. The gate is assumed to be unitary:
+                no orthonormalization or renormalization is performed.
+            node_index: Index of tensor (qubit) in the MPS to apply
+                the gate to.
+
+        Raises:
+            ValueError: On invalid MPS, invalid index, or dimension mismatch
+                between the diagonal and the MPS qudit dimension.
+        """
+        if not self.is_valid():
+            raise ValueError("MPS is invalid.")
+
+        if node_index not in range(self._nqudits):
+            raise ValueError(
+                f"Input tensor index={node_index} is out of bounds for"
+                f" an MPS on {self._nqudits} qudits."
+            )
+
+        diagonal = np.asarray(diagonal)
+        if diagonal.shape != (self._qudit_dimension,):
+            raise ValueError(
+                f"Diagonal has {diagonal.size} entries but should have "
+                f"MPS qudit dimension = {self._qudit_dimension}."
+            )
+
+        node = self._nodes[node_index]
+        free_edge = list(node.get_all_dangling())[0]
+        axis = free_edge.axis1
+
+        # Broadcast the diagonal along the physical axis of the site tensor
+        newshape = [1] * len(node.tensor.shape)
+        newshape[axis] = self._qudit_dimension
+        node.set_tensor(node.tensor * np.reshape(diagonal, newshape))
+
     def orthonormalize_right_edge_of(
             self, node_index: int, threshold: float = 1e-8
     ) -> None:
@@ -1017,7 +1189,7 @@ class MPS:
                 " and zero connected edges."
             )
 
-        edge_dimensions = set([edge.dimension for edge in gate.edges])
+        edge_dimensions = set(edge.dimension for edge in gate.edges)
         if len(edge_dimensions) != 1:
             raise ValueError("All gate edges must have the same dimension.")
 
@@ -1261,9 +1433,14 @@ class MPS:
             raise ValueError("Input MPS Operation is not valid.")
 
         if operation.is_single_qudit_operation():
-            self.apply_one_qudit_gate(
-                operation.node(), *operation.qudit_indices, **kwargs
-            )
+            if operation.is_diagonal() and operation.is_unitary():
+                self.apply_one_qudit_diagonal_gate(
+                    operation.diagonal(), *operation.qudit_indices
+                )
+            else:
+                self.apply_one_qudit_gate(
+                    operation.node(), *operation.qudit_indices, **kwargs
+                )
         elif operation.is_two_qudit_operation():
             self.apply_two_qudit_gate(
                 operation.node(), *operation.qudit_indices, **kwargs
@@ -68,6 +68,86 @@ def test_two_qubit_mps_operation_nonlocal_cnot():
     assert mps_operation.is_two_qudit_operation()
 
 
+def test_is_diagonal_mps_operation():
+    """Tests checking if MPS Operations are diagonal."""
+    diagonal_operation = MPSOperation(zgate(), qudit_indices=0)
+    assert diagonal_operation.is_diagonal()
+    assert np.allclose(diagonal_operation.diagonal(), [1.0, -1.0])
+
+    non_diagonal_operation = MPSOperation(hgate(), qudit_indices=0)
+    assert not non_diagonal_operation.is_diagonal()
+
+    cnot_operation = MPSOperation(cnot(), qudit_indices=(0, 1))
+    assert not cnot_operation.is_diagonal()
+
+
+def test_apply_diagonal_one_qudit_gate():
+    """Tests the diagonal fast path agrees with the full gate contraction."""
+    mps = MPS(nqudits=2)
+    mps.h(-1)
+    mps_dense = mps.copy()
+
+    operation = MPSOperation(zgate(), qudit_indices=0)
+    assert operation.is_diagonal() and operation.is_unitary()
+    mps._apply_mps_operation(operation)
+    mps_dense.apply_one_qudit_gate(zgate(), 0)
+
+    assert np.allclose(mps.wavefunction(), mps_dense.wavefunction())
+
+
+def test_apply_diagonal_one_qudit_gate_invalid_diagonal():
+    """Tests that an invalid diagonal raises an error."""
+    mps = MPS(nqudits=2)
+    with pytest.raises(ValueError):
+        mps.apply_one_qudit_diagonal_gate(np.ones(3), node_index=0)
+
+
+def test_mps_operation_from_raw_tensor():
+    """Tests an MPS Operation constructed from a raw gate tensor."""
+    tensor = np.identity(2, dtype=np.complex64)
+    mps_operation = MPSOperation(tensor, qudit_indices=0, qudit_dimension=2)
+    assert mps_operation.is_valid()
+    assert mps_operation.is_unitary()
+    assert mps_operation.is_single_qudit_operation()
+    assert np.allclose(mps_operation.tensor(), tensor)
+
+    # Each call to node() wraps the stored tensor in a new node.
+    node = mps_operation.node()
+    assert isinstance(node, tn.Node)
+    assert node is not mps_operation.node()
+    assert node.tensor is mps_operation.node().tensor
+
+
+def test_contract_expression_one_qubit_mps_operation():
+    """Tests applying a gate through a cached contraction expression."""
+    np.random.seed(2)
+    mps_operation = MPSOperation(hgate(), qudit_indices=0, qudit_dimension=2)
+    site_tensor = np.random.randn(2, 3, 4)
+
+    expression = mps_operation.contract_expression(site_tensor.shape)
+    result = expression(mps_operation.tensor(), site_tensor)
+    correct = np.tensordot(mps_operation.tensor(), site_tensor, axes=(1, 0))
+    assert np.allclose(result, correct)
+
+    # Expressions are cached by site shape.
+    assert mps_operation.contract_expression(site_tensor.shape) is expression
+
+
+def test_contract_expression_invalid():
+    """Tests errors raised for invalid contraction expression arguments."""
+    two_qudit_operation = MPSOperation(
+        cnot(), qudit_indices=(0, 1), qudit_dimension=2
+    )
+    with pytest.raises(ValueError):
+        two_qudit_operation.contract_expression(site_shape=(2, 1, 1))
+
+    one_qudit_operation = MPSOperation(
+        hgate(), qudit_indices=0, qudit_dimension=2
+    )
+    with pytest.raises(ValueError):
+        one_qudit_operation.contract_expression(site_shape=(3, 1, 1))
+
+
 def test_mps_one_qudit():
     """Ensures an error is raised if the number of qudits is less than two."""
     for d in (2, 3, 10, 20, 100):
@@ -9,6 +9,29 @@ from scipy.stats import unitary_group
 
 import tensornetwork as tn
 
+try:
+    import numba
+
+    @numba.njit(cache=True, fastmath=True)
+    def _max_deviation_from_identity(matrix: np.ndarray) -> float:
+        """Returns max_ij |(U^dag @ U - I)_ij| for a square matrix U."""
+        product = matrix.conj().T @ matrix
+        dim = product.shape[0]
+        deviation = 0.0
+        for i in range(dim):
+            for j in range(dim):
+                target = 1.0 if i == j else 0.0
+                deviation = max(deviation, abs(product[i, j] - target))
+        return deviation
+
+except ImportError:  # Numba is optional; fall back to pure NumPy.
+    def _max_deviation_from_identity(matrix: np.ndarray) -> float:
+        """Returns max_ij |(U^dag @ U - I)_ij| for a square matrix U."""
+        dim = matrix.shape[0]
+        return float(np.max(np.abs(
+            matrix.conj().T @ matrix - np.identity(dim)
+        )))
+
 
 # Helper functions
 # TODO: Reduce code duplication in helper functions
@@ -28,9 +51,7 @@ def is_unitary(gate: Union[np.ndarray, tn.Node]) -> bool:
         gate = np.reshape(gate, newshape=(dim, dim))
 
     # Check that the matrix is unitary
-    return np.allclose(
-        gate.conj().T @ gate, np.identity(gate.shape[0]), atol=1e-5
-    )
+    return bool(_max_deviation_from_identity(gate) <= 1e-5)
 
 
 def is_hermitian(gate: Union[np.ndarray, tn.Node]) -> bool:
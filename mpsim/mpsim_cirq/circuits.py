@@ -1,6 +1,9 @@
 """Defines mpsim circuits as extensions of Cirq circuits."""
 
-from typing import Dict, List
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import os
+from typing import Dict, Iterator, List, Optional, Tuple
 
 import numpy as np
 
@@ -9,15 +12,99 @@ import tensornetwork as tn
 from mpsim.core import MPSOperation, CannotConvertToMPSOperation
 
 
+# Minimum number of operations before circuit translation is dispatched
+# to a thread pool. Below this the pool overhead outweighs the work.
+_PARALLEL_TRANSLATION_THRESHOLD = 256
+
+
+def _array_module(backend: str):
+    """Returns the array module (numpy or cupy) for the given backend.
+
+    Args:
+        backend: Either "numpy" or "cupy".
+
+    Raises:
+        ImportError: If backend is "cupy" but CuPy is not installed.
+        ValueError: On any other backend.
+    """
+    if backend == "numpy":
+        return np
+    if backend == "cupy":
+        try:
+            import cupy
+        except ImportError:
+            raise ImportError(
+                "The 'cupy' backend requires CuPy to be installed. "
+                "See https://docs.cupy.dev/en/stable/install.html."
+            )
+        return cupy
+    raise ValueError(
+        f"Invalid backend '{backend}'. Valid backends are 'numpy' and 'cupy'."
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _unitary_for_gate(
+        gate: cirq.Gate,
+        backend: str = "numpy",
+        dtype: np.dtype = np.complex128
+) -> Optional[np.ndarray]:
+    """Returns the reshaped unitary tensor for a gate, memoized by gate,
+    or None if the gate has no unitary.
+
+    Circuits typically contain many repetitions of a small set of gates,
+    so caching by gate identity avoids recomputing the unitary and
+    reshaping for every operation. The returned tensor is marked read-only
+    (on the numpy backend) since it is shared between all operations with
+    the same gate.
+
+    Args:
+        gate: Gate to get the unitary tensor of. Must be hashable.
+        backend: Array backend for the tensor, either "numpy" or "cupy".
+        dtype: Data type for the tensor. Single precision (np.complex64)
+            halves memory traffic at a small cost in accuracy.
+    """
+    # A single protocol call does the work of both _has_unitary_ and
+    # _unitary_, which often cost the same.
+    unitary = cirq.unitary(gate, default=None)
+    if unitary is None:
+        return None
+    xp = _array_module(backend)
+    num_qudits = gate.num_qubits()
+    qudit_dimension = 2
+    newshape = (qudit_dimension,) * (2 * num_qudits)
+    if backend == "numpy":
+        # Force C-contiguity once so the reshape below is always a view.
+        # Cirq can return non-contiguous unitaries (e.g. from transposes),
+        # for which a plain reshape would silently copy.
+        tensor = np.ascontiguousarray(unitary, dtype=dtype).reshape(newshape)
+        tensor.flags.writeable = False
+    else:
+        tensor = xp.reshape(xp.asarray(unitary, dtype=dtype), newshape)
+    return tensor
+
+
 def mps_operation_from_gate_operation(
         gate_operation: cirq.GateOperation,
-        qudit_to_index_map: Dict[cirq.Qid, int]
+        qudit_to_index_map: Dict[cirq.Qid, int],
+        gate_to_node: Optional[Dict[cirq.Gate, tn.Node]] = None,
+        backend: str = "numpy",
+        dtype: np.dtype = np.complex128
 ) -> MPSOperation:
     """Constructs an MPS Operation from a gate operation.
 
     Args:
         gate_operation: A valid cirq.GateOperation or any child class.
         qudit_to_index_map: Dictionary to map qubits to MPS indices.
+        gate_to_node: Optional dictionary mapping gates to previously
+            constructed nodes. If given, operations whose gate appears in
+            the dictionary reuse the stored node, and nodes for new
+            (hashable) gates are added to it.
+        backend: Array backend for the gate tensor, either "numpy"
+            (default) or "cupy". The "cupy" backend stores gate tensors on
+            the GPU and is experimental.
+        dtype: Data type for the gate tensor. Default is np.complex128;
+            np.complex64 halves memory traffic at a small cost in accuracy.
 
     Raises:
         CannotConvertToMPSOperation
@@ -26,20 +113,45 @@ def mps_operation_from_gate_operation(
     num_qudits = len(gate_operation.qubits)
     qudit_dimension = 2  # TODO: Check if all Cirq ops are qubit ops
     qudit_indices = tuple(
-        [qudit_to_index_map[qudit] for qudit in gate_operation.qubits]
+        qudit_to_index_map[qudit] for qudit in gate_operation.qubits
     )
 
-    if not gate_operation._has_unitary_():
+    gate = gate_operation.gate
+    try:
+        tensor = _unitary_for_gate(gate, backend, dtype)
+        cacheable = True
+    except TypeError:  # Unhashable gate, cannot be memoized.
+        tensor = None
+        unitary = cirq.unitary(gate_operation, default=None)
+        if unitary is not None:
+            newshape = (qudit_dimension,) * (2 * num_qudits)
+            if backend == "numpy":
+                tensor = np.ascontiguousarray(
+                    unitary, dtype=dtype
+                ).reshape(newshape)
+            else:
+                xp = _array_module(backend)
+                tensor = xp.reshape(xp.asarray(unitary, dtype=dtype), newshape)
+        cacheable = False
+
+    if tensor is None:
         raise CannotConvertToMPSOperation(
             f"Cannot convert operation {gate_operation} into an MPS Operation"
             " because the operation does not have a unitary."
         )
 
-    tensor = gate_operation._unitary_()
-    tensor = np.reshape(
-        tensor, newshape=[qudit_dimension] * 2 * num_qudits
-    )
-    node = tn.Node(tensor)
+    # Single-qudit gates store the raw tensor; nodes are built lazily by
+    # MPSOperation only when the gate is applied.
+    if num_qudits == 1:
+        return MPSOperation(tensor, qudit_indices, qudit_dimension)
+
+    node = None
+    if gate_to_node is not None and cacheable:
+        node = gate_to_node.get(gate)
+    if node is None:
+        node = tn.Node(tensor)
+        if gate_to_node is not None and cacheable:
+            gate_to_node[gate] = node
     return MPSOperation(node, qudit_indices, qudit_dimension)
 
 
@@ -51,10 +163,12 @@ class MPSimCircuit(cirq.Circuit):
     an MPS Simulator.
     """
     def __init__(
-        self, 
+        self,
         cirq_circuit: cirq.Circuit,
         device: cirq.devices = cirq.devices.UNCONSTRAINED_DEVICE,
-        qubit_order: cirq.ops.QubitOrder = cirq.ops.QubitOrder.DEFAULT
+        qubit_order: cirq.ops.QubitOrder = cirq.ops.QubitOrder.DEFAULT,
+        backend: str = "numpy",
+        dtype: np.dtype = np.complex128
     ) -> None:
         """Constructor for MPSimCircuit.
 
@@ -62,12 +176,108 @@ class MPSimCircuit(cirq.Circuit):
             cirq_circuit: Cirq circuit to create an MPS Sim circuit from.
             device: Device the circuit runs on.
             qubit_order: Ordering of qubits.
+            backend: Array backend for gate tensors, either "numpy"
+                (default) or "cupy". The "cupy" backend stores gate tensors
+                on the GPU and is experimental.
+            dtype: Data type for gate tensors. Default is np.complex128;
+                np.complex64 halves memory traffic at a small cost in
+                accuracy.
         """
         super().__init__(cirq_circuit, device=device)
+        _array_module(backend)  # Validate the backend.
+        self._backend = backend
+        self._dtype = dtype
+
+        # Walk the circuit once, collecting both the gate operations (in
+        # application order) and the qubits they act on.
+        qubits_seen = set()  # type: set
+        gate_operations = []  # type: List[cirq.GateOperation]
+        for moment in self:
+            for operation in moment:
+                gate_operations.append(operation)
+                qubits_seen.update(operation.qubits)
+        self._gate_operations = gate_operations
         self._qudit_to_index_map = {
-            qubit: i for i, qubit in enumerate(sorted(self.all_qubits()))
+            qubit: i for i, qubit in enumerate(sorted(qubits_seen))
         }  # TODO: Account for qubit order instead of always using sorted order.
-        self._mps_operations = self._translate_to_mps_operations()
+        self._mps_operations_cache = None  # type: Optional[List[MPSOperation]]
+        self._gate_tensor_arrays = (
+            {}
+        )  # type: Dict[int, Tuple[np.ndarray, np.ndarray]]
+
+    @property
+    def _mps_operations(self) -> List[MPSOperation]:
+        """Returns the MPS Operations of the circuit, materializing them on
+        first access.
+
+        Large circuits are translated on a thread pool: conversions of
+        independent operations mostly run NumPy code which releases the
+        GIL, and repeated gates hit the shared gate-tensor cache.
+        """
+        if self._mps_operations_cache is None:
+            operations = self._gate_operations
+            if len(operations) >= _PARALLEL_TRANSLATION_THRESHOLD:
+                gate_to_node = {}  # type: Dict[cirq.Gate, tn.Node]
+                convert = functools.partial(
+                    MPSOperation.from_gate_operation,
+                    qudit_to_index_map=self._qudit_to_index_map,
+                    gate_to_node=gate_to_node,
+                    backend=self._backend,
+                    dtype=self._dtype,
+                )
+                with ThreadPoolExecutor(
+                        max_workers=os.cpu_count()
+                ) as executor:
+                    self._mps_operations_cache = list(
+                        executor.map(convert, operations)
+                    )
+            else:
+                self._mps_operations_cache = list(self._iter_mps_operations())
+        return self._mps_operations_cache
+
+    @property
+    def mps_operations(self) -> List[MPSOperation]:
+        """Returns the MPS Operations of the circuit, in application order."""
+        return self._mps_operations
+
+    def gate_tensor_arrays(
+            self, num_qudits: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns the gate tensors of all operations acting on the given
+        number of qudits, stacked into a single contiguous array.
+
+        Storing the tensors contiguously (rather than one node per
+        operation) lets downstream code batch-apply gates of the same
+        arity with a single contraction call.
+
+        Args:
+            num_qudits: Number of qudits the returned operations act on.
+
+        Returns:
+            A tuple (tensors, qudit_indices) where tensors has shape
+            (noperations, d, ..., d) with 2 * num_qudits trailing axes, and
+            qudit_indices has shape (noperations, num_qudits). Row i of
+            qudit_indices holds the qudit indices of the operation whose
+            gate tensor is tensors[i]. Rows are in application order.
+        """
+        if num_qudits not in self._gate_tensor_arrays:
+            operations = [
+                mps_operation for mps_operation in self._mps_operations
+                if mps_operation.num_qudits == num_qudits
+            ]
+            d = 2  # TODO: Check if all Cirq ops are qubit ops
+            if operations:
+                tensors = np.stack(
+                    [op.node(copy=False).tensor for op in operations]
+                )
+                qudit_indices = np.array(
+                    [op.qudit_indices for op in operations], dtype=np.intp
+                )
+            else:
+                tensors = np.empty((0,) + (d,) * (2 * num_qudits))
+                qudit_indices = np.empty((0, num_qudits), dtype=np.intp)
+            self._gate_tensor_arrays[num_qudits] = (tensors, qudit_indices)
+        return self._gate_tensor_arrays[num_qudits]
 
     def _resolve_parameters_(self, param_resolver: cirq.study.ParamResolver):
         """Returns a circuit with all parameters resolved by the param_resolver.
@@ -79,15 +289,21 @@ class MPSimCircuit(cirq.Circuit):
         mpsim_circuit.device = self.device
         return mpsim_circuit
 
-    def _translate_to_mps_operations(self) -> List[MPSOperation]:
-        """Appends all operations in a circuit to MPS Operations."""
-        all_mps_operations = []
-        for (moment_index, moment) in enumerate(self):
-            for operation in moment:
-                all_mps_operations.append(
-                    MPSOperation.from_gate_operation(
-                        operation,
-                        self._qudit_to_index_map
-                    )
-                )
-        return all_mps_operations
+    def _iter_mps_operations(self) -> Iterator[MPSOperation]:
+        """Yields the MPS Operations of the circuit, in application order.
+
+        Operations are translated lazily, so consumers which process them
+        sequentially never hold more than the operations translated so far
+        in memory. Operations which share a gate also share a single node,
+        so node construction happens once per distinct gate rather than
+        once per operation.
+        """
+        gate_to_node = {}  # type: Dict[cirq.Gate, tn.Node]
+        for operation in self._gate_operations:
+            yield MPSOperation.from_gate_operation(
+                operation,
+                self._qudit_to_index_map,
+                gate_to_node,
+                self._backend,
+                self._dtype
+            )
@@ -1,6 +1,7 @@
 """Tests for MPSIM Circuits."""
 
 import numpy as np
+import pytest
 
 import cirq
 
@@ -53,6 +54,46 @@ def test_mps_operation_from_gate_operation_nonlocal_cnot():
     assert np.allclose(mps_operation.tensor(), operation._unitary_())
 
 
+def test_repeated_gates_share_unitary_tensor():
+    """Tests that operations with the same gate share one unitary tensor."""
+    qreg = cirq.LineQubit.range(2)
+    operations = [cirq.ops.H.on(qreg[0]), cirq.ops.H.on(qreg[1])]
+    qubit_to_index_map = {qreg[0]: 0, qreg[1]: 1}
+
+    mps_operations = [
+        MPSOperation.from_gate_operation(operation, qubit_to_index_map)
+        for operation in operations
+    ]
+    assert (mps_operations[0].node(copy=False).tensor
+            is mps_operations[1].node(copy=False).tensor)
+    for mps_operation in mps_operations:
+        assert np.allclose(mps_operation.tensor(), cirq.unitary(cirq.ops.H))
+
+
+def test_translated_operations_share_tensors_for_repeated_gates():
+    """Tests that translating a circuit builds one tensor per distinct gate
+    and one node per distinct two-qudit gate.
+    """
+    qreg = cirq.LineQubit.range(3)
+    cirq_circuit = cirq.Circuit(
+        [
+            *cirq.ops.H.on_each(*qreg),
+            cirq.ops.CNOT.on(qreg[0], qreg[1]),
+            cirq.ops.CNOT.on(qreg[1], qreg[2]),
+        ]
+    )
+
+    mpsim_circuit = MPSimCircuit(cirq_circuit)
+    mps_operations = mpsim_circuit._mps_operations
+
+    assert len(mps_operations) == 5
+    tensors = [mps_op.node(copy=False).tensor for mps_op in mps_operations]
+    assert tensors[0] is tensors[1] is tensors[2]
+
+    cnot_nodes = [mps_op.node(copy=False) for mps_op in mps_operations[3:]]
+    assert cnot_nodes[0] is cnot_nodes[1]
+
+
 def test_instantiate_empty_circuit():
     """Tests instantiating an mpsim circuit from an empty Cirq circuit."""
     cirq_circuit = cirq.Circuit()
@@ -120,6 +161,89 @@ def test_two_qubit_circuit_unconstrained_device():
     assert mps_operations[1].qudit_indices == (0, 1)
 
 
+def test_invalid_backend_raises_error():
+    """Tests that an unknown array backend raises an error."""
+    qreg = cirq.LineQubit.range(2)
+    cirq_circuit = cirq.Circuit([cirq.ops.H.on(qreg[0])])
+    with pytest.raises(ValueError):
+        MPSimCircuit(cirq_circuit, backend="tensorflow")
+
+
+def test_explicit_numpy_backend():
+    """Tests that the default backend can be passed explicitly."""
+    qreg = cirq.LineQubit.range(2)
+    cirq_circuit = cirq.Circuit(
+        [cirq.ops.H.on(qreg[0]), cirq.ops.CNOT.on(*qreg)]
+    )
+    mpsim_circuit = MPSimCircuit(cirq_circuit, backend="numpy")
+    for mps_operation in mpsim_circuit._mps_operations:
+        assert isinstance(mps_operation.node(copy=False).tensor, np.ndarray)
+
+
+def test_single_precision_gate_tensors():
+    """Tests storing gate tensors in single precision."""
+    qreg = cirq.LineQubit.range(2)
+    cirq_circuit = cirq.Circuit(
+        [cirq.ops.H.on(qreg[0]), cirq.ops.CNOT.on(*qreg)]
+    )
+    mpsim_circuit = MPSimCircuit(cirq_circuit, dtype=np.complex64)
+
+    for mps_operation in mpsim_circuit._mps_operations:
+        assert mps_operation.node(copy=False).tensor.dtype == np.complex64
+        assert mps_operation.is_unitary()
+
+    mps = mpsim.MPS(nqudits=2)
+    for mps_operation in mpsim_circuit._mps_operations:
+        mps._apply_mps_operation(mps_operation)
+    correct = 1 / np.sqrt(2) * np.array([1., 0., 0., 1.])
+    assert np.allclose(mps.wavefunction(), correct)
+
+
+def test_gate_tensor_arrays():
+    """Tests stacking gate tensors of a circuit by number of qudits."""
+    qreg = cirq.LineQubit.range(2)
+    gate_operations = [
+        cirq.ops.H.on(qreg[0]), cirq.ops.H.on(qreg[1]),
+        cirq.ops.CNOT.on(*qreg)
+    ]
+    mpsim_circuit = MPSimCircuit(cirq.Circuit(gate_operations))
+
+    tensors, qudit_indices = mpsim_circuit.gate_tensor_arrays(num_qudits=1)
+    assert tensors.shape == (2, 2, 2)
+    assert np.allclose(tensors[0], cirq.unitary(cirq.ops.H))
+    assert np.allclose(tensors[1], cirq.unitary(cirq.ops.H))
+    assert qudit_indices.shape == (2, 1)
+    assert tuple(qudit_indices.ravel()) == (0, 1)
+
+    tensors, qudit_indices = mpsim_circuit.gate_tensor_arrays(num_qudits=2)
+    assert tensors.shape == (1, 2, 2, 2, 2)
+    assert np.allclose(
+        np.reshape(tensors[0], (4, 4)), cirq.unitary(cirq.ops.CNOT)
+    )
+    assert qudit_indices.shape == (1, 2)
+
+    # No three-qudit operations in the circuit.
+    tensors, qudit_indices = mpsim_circuit.gate_tensor_arrays(num_qudits=3)
+    assert tensors.shape == (0, 2, 2, 2, 2, 2, 2)
+    assert qudit_indices.shape == (0, 3)
+
+
+def test_translate_deep_circuit():
+    """Tests translating a circuit deep enough to use parallel translation."""
+    qreg = cirq.LineQubit.range(2)
+    depth = 300
+    gate_operations = [
+        cirq.ops.H.on(qreg[i % 2]) for i in range(depth)
+    ]
+    mpsim_circuit = MPSimCircuit(cirq.Circuit(gate_operations))
+    mps_operations = mpsim_circuit._mps_operations
+
+    assert len(mps_operations) == depth
+    for i, mps_operation in enumerate(mps_operations):
+        assert mps_operation.qudit_indices == (i % 2,)
+        assert np.allclose(mps_operation.tensor(), cirq.unitary(cirq.ops.H))
+
+
 def test_convert_and_manually_simulate_circuit_two_qubits():
     """Tests the following:
 